@@ -1,8 +1,13 @@
 """ Importing Solidification-Model data from json in Pandas Dataframes"""
+from functools import cached_property
+
 import pandas as pd
 import numpy as np
 from icmdoutput.redundant_data import PhasesAndTemps
 
+# Unit order of temperature_by_phase_region differs from temperature_values
+_REGION_UNIT_IDX = {"C": 0, "F": 1, "K": 2}
+
 
 class Solidification(PhasesAndTemps):
     """Solidification data of a JSON model."""
@@ -15,6 +20,11 @@ class Solidification(PhasesAndTemps):
     def _get_temp_regions(self):
         return self.data["data_vars"]["temperature_by_phase_region"]["data"]
 
+    @cached_property
+    def _temp_regions_arr(self) -> np.ndarray:
+        """Temperature by phase region as object array, keeping "None" markers."""
+        return np.asarray(self._get_temp_regions(), dtype=object)
+
     def _get_percent_solid_molar(self):
         return self.data["data_vars"]["percent_solidified_molar_values"]["data"][0]
 
@@ -26,12 +36,12 @@ class Solidification(PhasesAndTemps):
 
     def get_temperature_by_phase_region(self, unit="C") -> pd.DataFrame:
         """Return temperature by phase region."""
-        idx = {"C": 0, "F": 1, "K": 2}.get(unit)
+        idx = _REGION_UNIT_IDX.get(unit)
         if idx is None:
             raise ValueError(f"Unsupported temperature unit: '{unit}'")
 
-        data = np.array(self._get_temp_regions())[0, :, :, idx]
-        return pd.DataFrame(data, columns=self._get_solid_regions())
+        data = self._temp_regions_arr[0, :, :, idx]
+        return pd.DataFrame(data, columns=self._get_solid_regions()).infer_objects()
 
     def get_percent_solidified_molar(self) -> pd.DataFrame:
         """Return percentage of solidification."""
@@ -40,9 +50,23 @@ class Solidification(PhasesAndTemps):
     def get_data_for_scheil_plot(self, temp_unit="C") -> pd.DataFrame:
         """Return DataFrame suitable for Scheil plot construction."""
         phase_region = self.get_temperature_by_phase_region(unit=temp_unit).drop(['LIQUID'], axis=1)
-        melted = phase_region.replace("None", np.nan).apply(lambda row: row.first_valid_index(), axis=1)
-        result = pd.DataFrame({"Phase Region": melted})
-        temps = self.get_temperatures()
-        df = self.get_percent_solidified_molar()
-        return pd.concat([df, temps, result["Phase Region"]], axis=1, join="inner")
+
+        # First valid region per row, found in one pass over a boolean mask
+        arr = phase_region.to_numpy()
+        mask = (arr != "None") & pd.notna(arr)
+        if mask.shape[1] == 0:
+            melted = np.full(mask.shape[0], np.nan, dtype=object)
+        else:
+            first_idx = mask.argmax(axis=1)
+            melted = np.asarray(phase_region.columns, dtype=object)[first_idx]
+            melted[~mask.any(axis=1)] = np.nan
+
+        percent = np.asarray(self._get_percent_solid_molar())
+        temps = self._get_temperatures(temp_unit, parameter=False)
+        n = min(len(percent), len(temps), len(melted))
+        return pd.DataFrame({
+            "Percent solidified molar": percent[:n],
+            f"Temperature in {temp_unit}": temps[:n],
+            "Phase Region": melted[:n],
+        })
     
\ No newline at end of file
@@ -1,18 +1,42 @@
+from dataclasses import dataclass
+
 import ipywidgets as widgets
 from IPython.display import display
 import numpy as np
 import plotly.graph_objects as go
 
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+@dataclass(frozen=True, eq=False)
+class _KeyIndex:
+    '''Composition keys of a data_dict as array, with values and KD-tree'''
+    keys_arr: np.ndarray
+    values_list: list
+    tree: object = None
+
+    @classmethod
+    def from_dict(cls, data_dict):
+        keys_arr = np.ascontiguousarray(list(data_dict.keys()), dtype=np.float64)
+        tree = cKDTree(keys_arr) if cKDTree is not None else None
+        return cls(keys_arr, list(data_dict.values()), tree)
+
 def make_elem_sliders(comp_cols, comp_array):
-    '''Create selection sliders for all components except Al'''
+    '''Create selection sliders for all components except Al
+
+    comp_array is the composition key array or a _KeyIndex built from it.
+    '''
 
     #Add fallback for big datasets
 
+    comp_array = np.asarray(getattr(comp_array, "keys_arr", comp_array), dtype=np.float64)
     sliders = {}
     for i, c in enumerate(comp_cols):
         if c == "Al":
             continue
-        values = sorted(set(comp_array[:, i]))
+        values = np.unique(comp_array[:, i]).tolist()
         sliders[c] = widgets.SelectionSlider(
             options = values,
             value = values[len(values) // 2],
@@ -24,11 +48,12 @@ def make_elem_sliders(comp_cols, comp_array):
 def make_phase_slider(phase_cols, phase_df):
     '''Create selection slider for maximal phase fraction over all phases'''
 
+    phase_array = phase_df[phase_cols].to_numpy(dtype=np.float64)
     sliders = {}
     for i, c in enumerate(phase_cols):
         if c == "SOLID" or c == "LIQUID":
             continue
-        values = sorted(set(phase_df[phase_cols].values[:, i]))
+        values = np.unique(phase_array[:, i]).tolist()
         sliders[c] = widgets.SelectionSlider(
             options = values, 
             value = values[len(values) // 2],
@@ -60,8 +85,11 @@ def get_data_slice_from_phase(data_dict, target, phase_cols ,phase_df):
     return data_dict[nearest_key], element_comp 
 
 
-def get_data_slice(data_dict, target):
-    '''FInd matching data entry for given composition, handling rounding errors'''
+def get_data_slice(data_dict, target, key_index=None):
+    '''FInd matching data entry for given composition, handling rounding errors
+
+    Pass a prebuilt _KeyIndex to avoid rebuilding it on every call.
+    '''
     # Add Al as the remainder to make total = 100
 
     target = {"Al": max(0.0, 100 - sum(target.values())), **target}
@@ -72,22 +100,31 @@ def get_data_slice(data_dict, target):
         return data_dict[key], target
 
     # Otherwise find closest key numerically
-    keys = np.array(list(data_dict.keys()))
-    diffs = np.linalg.norm(keys - np.array(list(key)), axis=1)
-    nearest_key = tuple(keys[np.argmin(diffs)])
-    return data_dict[nearest_key], target
+    if key_index is None:
+        key_index = _KeyIndex.from_dict(data_dict)
+    query_point = np.array(key)
+    if key_index.tree is not None:
+        _, idx = key_index.tree.query(query_point, k=1)
+    else:
+        # Squared distance has the same argmin, no sqrt needed
+        idx = int(((key_index.keys_arr - query_point) ** 2).sum(axis=1).argmin())
+    return key_index.values_list[idx], target
+
+def fraction_arrays(g, cols):
+    '''Return NaN-free float arrays for the given columns of g'''
+    return {c: np.nan_to_num(np.asarray(g[c], dtype=np.float64), nan=0.0) for c in cols}
 
 def plot_composition_step(g, comp_cols, target, t_col="Temperature in C", liquid_col="LIQUID"):
     '''Plot temperature vs phase fracstions'''
     fig = go.Figure()
-    t = g[t_col]
-    f_liq = np.nan_to_num(g[liquid_col], nan=0.0)
-    fig.add_trace(go.Scatter(x=t, y=f_liq, mode='lines', name='LIQUID', 
+    phases = [c for c in g.keys() if c not in {t_col, liquid_col, *comp_cols}]
+    cols = fraction_arrays(g, [liquid_col, *phases])
+    t = np.asarray(g[t_col])
+    fig.add_trace(go.Scatter(x=t, y=cols[liquid_col], mode='lines', name='LIQUID', 
                              line={'color': 'black', 'width': 2}))
 
-    phases = [c for c in g.keys() if c not in {t_col, liquid_col, *comp_cols}]
     for p in phases:
-        f = np.nan_to_num(g[p], nan=0.0)
+        f = cols[p]
         if f.max() > 0.0001:
             fig.add_trace(go.Scatter(x=t, y=f, mode='lines', name=p))
 
@@ -116,28 +153,26 @@ def plot_composition_step(g, comp_cols, target, t_col="Temperature in C", liquid
 def plot_composition_scheil(g, comp_cols, target, t_col="Temperature in C", solid_col="SOLID", liquid_col="LIQUID"):
     '''Plot solid fraction over Temperature'''
     fig = go.Figure()
+    phases = [c for c in g.keys() if c not in {t_col, solid_col, liquid_col, *comp_cols}]
+    cols = fraction_arrays(g, [solid_col, *phases])
+
     # Temperature and solid fraction arrays
-    t = g[t_col]
-    f_solid = np.nan_to_num(g[solid_col], nan=0.0)
+    t = np.asarray(g[t_col])
+    f_solid = cols[solid_col]
     fig.add_trace(go.Scatter(
         x=f_solid, y=t, mode="lines", name="Solid", line={'color':"black", 'width':2}, showlegend=False
     ))
 
     # Nur Marker für das erste Auftreten jeder Phase
-    phases = [c for c in g.keys() if c not in {t_col, solid_col, liquid_col, *comp_cols}]
+    threshold = 1e-4
     for p in phases:
-        f = np.nan_to_num(g[p], nan=0.0)
-        #print(f)
         # Skip empty or near-zero phases
-        if np.all(f <= 0):
+        mask = cols[p][1:] > threshold
+        if not mask.any():
             continue
 
         # Get first valid occurrence
-        threshold = 1e-4
-        onset_candidates = np.where(f[1:] > threshold)[0]
-        if len(onset_candidates) == 0:
-            continue
-        onset_idx = onset_candidates[-1]
+        onset_idx = len(mask) - 1 - int(np.argmax(mask[::-1]))
 
         fig.add_trace(go.Scatter(
             x=[f_solid[onset_idx]],  # Punkt auf Liquidus-Linie
@@ -166,13 +201,13 @@ def plot_composition_scheil(g, comp_cols, target, t_col="Temperature in C", soli
 
 def make_interactive_step(comp_cols, data_dict, t_col="Temperature in C", liquid_col="LIQUID"):
     """Main function combining sliders, plot, and interactivity."""
-    comp_array = np.array(list(data_dict.keys()))
-    sliders = make_elem_sliders(comp_cols, comp_array)
+    key_index = _KeyIndex.from_dict(data_dict)
+    sliders = make_elem_sliders(comp_cols, key_index)
     out = widgets.Output()
 
     def update_plot(**kwargs):
         out.clear_output(wait=True)
-        g, target = get_data_slice(data_dict, kwargs)
+        g, target = get_data_slice(data_dict, kwargs, key_index)
         with out:
             plot_composition_step(g, comp_cols, target, t_col, liquid_col)
 
@@ -182,13 +217,13 @@ def make_interactive_step(comp_cols, data_dict, t_col="Temperature in C", liquid
 
 def make_interactive_scheil(comp_cols, data_dict, t_col="Temperature in C", solid_col="SOLID", liquid_col="LIQUID"):
     """Main function combining sliders, plot, and interactivity."""
-    comp_array = np.array(list(data_dict.keys()))
-    sliders = make_elem_sliders(comp_cols, comp_array)
+    key_index = _KeyIndex.from_dict(data_dict)
+    sliders = make_elem_sliders(comp_cols, key_index)
     out = widgets.Output()
 
     def update_plot(**kwargs):
         out.clear_output(wait=True)
-        g, target = get_data_slice(data_dict, kwargs)
+        g, target = get_data_slice(data_dict, kwargs, key_index)
         with out:
             plot_composition_scheil(g, comp_cols, target, t_col, solid_col, liquid_col)
 
@@ -198,7 +233,7 @@ def make_interactive_scheil(comp_cols, data_dict, t_col="Temperature in C", soli
 
 def make_interactive_step_byphase(comp_cols, data_dict, phase_cols, phase_df, t_col="Temperature in C", liquid_col="LIQUID"):
     """Main function combining sliders, plot, and interactivity."""
-    comp_array = np.array(list(data_dict.keys()))
+    comp_array = np.ascontiguousarray(list(data_dict.keys()), dtype=np.float64)
     sliders = make_elem_sliders(comp_cols, comp_array)
     out = widgets.Output()
 
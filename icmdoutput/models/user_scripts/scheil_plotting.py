@@ -1,5 +1,7 @@
 """Module for plotting Solidification data."""
 
+from functools import cached_property
+
 import pandas as pd
 import plotly.express as px
 import numpy as np
@@ -7,36 +9,73 @@ import plotly.graph_objects as go
 from icmdoutput.models.solidification import Solidification
 
 
+def _encode_masks(mask: np.ndarray) -> np.ndarray:
+    """Pack each boolean row (at most 64 columns) into a uint64 bitmask."""
+    shifts = np.arange(mask.shape[1], dtype=np.uint64)
+    return (mask.astype(np.uint64) << shifts).sum(axis=1)
+
+
 class Scheil(Solidification):
     """Methods for plotting solidification (Scheil) data."""
 
-    def __init__(self, path: str, modelname: str):
-        super().__init__(path, modelname)
+    def __init__(self, path: str, modelname: str, float32: bool = False):
+        super().__init__(path, modelname, float32=float32)
+
+        # Phase columns without SOLID, shared by all region computations
+        phases = np.asarray(self.get_phase_names(), dtype=object)
+        self._phase_keep = phases != "SOLID"
+        self._phase_cols = phases[self._phase_keep]
+
         self.temp_by_phase = self._compute_temp_by_phase()
 
     # ------------------------------------------------------------------
 
-    def _get_present_phases(self, row: pd.Series, threshold: float) -> list[str]:
-        """Return list of phases with fraction above given threshold."""
-        df = self.get_phase_fraction()
-        phase_columns = [
-            c for c in df.columns if c not in ("Temperature in C", "SOLID")
-        ]
-        return [ph for ph in phase_columns if row[ph] > threshold]
+    @cached_property
+    def _pf_mole_arr(self) -> np.ndarray:
+        return self._get_phase_fraction("mole", parameter=False)[:, self._phase_keep]
+
+    @cached_property
+    def _pf_mass_arr(self) -> np.ndarray:
+        return self._get_phase_fraction("mass", parameter=False)[:, self._phase_keep]
+
+    def _phase_fraction_arr(self, unit: str = "mole") -> np.ndarray:
+        """Return cached (steps, phases) fractions for ``self._phase_cols``.
+
+        Arrays are built on first use per unit; ``unit`` is "mole" or "mass".
+        """
+        match unit:
+            case "mole":
+                return self._pf_mole_arr
+            case "mass":
+                return self._pf_mass_arr
+            case _:
+                raise ValueError(f"Unknown phase fraction unit '{unit}'")
 
     def _compute_temp_by_phase(self, threshold: float = 1e-6) -> pd.DataFrame:
         """Generate a DataFrame mapping temperature to phase regions."""
-        phase_df = self.get_phase_fraction(parameter=False)
-        temp_df = self.get_temperatures()
-
-        present = phase_df.apply(
-            lambda r: self._get_present_phases(r, threshold), axis=1
-        )
+        phase_cols = self._phase_cols.tolist()
+        present = self._phase_fraction_arr("mole") > threshold
+
+        # Consecutive temperatures mostly share a region, so build each
+        # distinct region string once, keyed by its row bitmask
+        if present.shape[1] <= 64:
+            unique, inverse = np.unique(_encode_masks(present), return_inverse=True)
+            strings = [
+                "+".join(sorted(c for j, c in enumerate(phase_cols) if key >> j & 1))
+                for key in unique.tolist()
+            ]
+        else:
+            unique, inverse = np.unique(present, axis=0, return_inverse=True)
+            strings = [
+                "+".join(sorted(c for c, m in zip(phase_cols, row) if m))
+                for row in unique
+            ]
+        regions = np.array(strings, dtype=object)[inverse.reshape(-1)]
 
         # Typo corrected: 'Temperature' not 'Temperatere'
         mapped = pd.DataFrame({
-            "Temperature in C": temp_df["Temperature in C"].values,
-            "Phase Region": present.apply(lambda ph: "+".join(sorted(ph))),
+            "Temperature in C": self._get_temperatures("C", parameter=False),
+            "Phase Region": regions,
         })
         return mapped
 
@@ -48,9 +87,17 @@ class Scheil(Solidification):
 
     def get_scheil_df(self, threshold: float = 1e-6) -> pd.DataFrame:
         """Return combined Scheil DataFrame (phase + temperature)."""
-        base = self.get_percent_solidified_molar()
+        base = self.get_percent_solidified_molar()["Percent solidified molar"]
         phase_info = self._compute_temp_by_phase(threshold)
-        return pd.concat([base, phase_info], axis=1).iloc[:-1]
+
+        # Slice once before assembly; the dict of Series aligns on the index
+        # like the outer concat did when the lengths differ
+        n = max(len(base), len(phase_info)) - 1
+        return pd.DataFrame({
+            "Percent solidified molar": base.iloc[:n],
+            "Temperature in C": phase_info["Temperature in C"].iloc[:n],
+            "Phase Region": phase_info["Phase Region"].iloc[:n],
+        })
 
     # ------------------------------------------------------------------
 
@@ -130,16 +177,15 @@ class Scheil(Solidification):
 
         # Drop 'SOLID' if present
         phase_cols = [p for p in self.get_phase_names() if p != "SOLID" and p in df]
-        df_long = (
-            df.melt(
-                id_vars=[temp_col],
-                value_vars=phase_cols,
-                var_name="Phase",
-                value_name="Phase Fraction",
-            )
-            .sort_values(temp_col)
-            .reset_index(drop=True)
-        )
+
+        # Long format built from arrays, temperatures sorted within each phase
+        temp_arr = df[temp_col].to_numpy()
+        order = np.argsort(temp_arr, kind="stable")
+        df_long = pd.DataFrame({
+            temp_col: np.tile(temp_arr[order], len(phase_cols)),
+            "Phase": np.repeat(np.asarray(phase_cols, dtype=object), len(temp_arr)),
+            "Phase Fraction": np.concatenate([df[p].to_numpy()[order] for p in phase_cols]),
+        })
 
         return self._scheil_plot_fig(df_long, temp_col, plotname, log, y_range)
     
\ No newline at end of file
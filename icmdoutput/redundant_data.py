@@ -1,75 +1,104 @@
 """Define Phase, Volume Fraction, and Temperature values for multiple models."""
 
+from functools import cached_property
+
+import numpy as np
 import pandas as pd
 from .json_import import SingleModel
 
+_UNIT_IDX = {"C": 0, "K": 1, "F": 2}
+
+
+def _to_soa(data, dtype=None) -> np.ndarray:
+    """Convert nested JSON lists to an array with the trailing unit axis moved first.
+
+    Each unit (e.g. C/K/F or mole/mass) then occupies one contiguous plane.
+    The array is cached per instance and handed out as views, so it is made
+    read-only: an accidental write raises instead of changing later results.
+    """
+    arr = np.ascontiguousarray(np.moveaxis(np.asarray(data, dtype=dtype), -1, 0))
+    arr.flags.writeable = False
+    return arr
+
 
 class PhasesAndTemps(SingleModel):
-    """Extract phase fraction, volume fraction, and temperature data from models."""
+    """Extract phase fraction, volume fraction, and temperature data from models.
+
+    With ``float32=True`` phase fractions are held in single precision, halving
+    memory and traffic for the threshold/mask passes over them.
+    """
+
+    def __init__(self, path: str, model_name: str, float32: bool = False):
+        super().__init__(path, model_name)
+        self._float32 = float32
 
     # --- Core field accessors -----------------------------------------------
 
     def get_phase_names(self):
         return self.data["coords"]["phase"]["data"]
 
-    def _get_temperatures(self, unit: str, parameter: bool):
+    @cached_property
+    def _temperature_soa(self) -> np.ndarray:
+        """Temperature data as (unit, blocks, steps) array."""
         try:
             temps = self.data["data_vars"]["temperature_values"]["data"]
         except KeyError:
             temps = self.data["data_vars"]["temperature"]["data"]
-        
+        return _to_soa(temps, dtype=float)
+
+    def _get_temperatures(self, unit: str, parameter: bool):
+        idx = _UNIT_IDX.get(unit)
+        if idx is None:
+            raise ValueError(f"Unknown temperature unit '{unit}'")
+
         if parameter:
-            match unit:
-                case "C":
-                    return [[row[0] for row in block] for block in temps]
-                case "K":
-                    return [[row[1] for row in block] for block in temps]
-                case "F":
-                    return [[row[2] for row in block] for block in temps]
-                case _:
-                    raise ValueError(f"Unknown temperature unit '{unit}'")
-
-        match unit:
-            case "C":
-                return [t[0] for t in temps[0]]
-            case "K":
-                return [t[1] for t in temps[0]]
-            case "F":
-                return [t[2] for t in temps[0]]
-            case _:
-                raise ValueError(f"Unknown temperature unit '{unit}'")
+            return self._temperature_soa[idx]
+        return self._temperature_soa[idx, 0]
 
     def _get_elements(self):
         return self.data["coords"]["component"]["data"]
 
     # --- Composition and phase fractions ------------------------------------
 
-    def _get_composition(self, phase: str, unit: str, phaselist: pd.DataFrame):
-        try:
-            phase_index = phaselist.isin([phase]).any(axis=1).idxmax()
-        except KeyError as exc:
-            raise KeyError(f"Phase '{phase}' not found in data") from exc
+    @cached_property
+    def _phase_index(self) -> dict:
+        """Map phase name to its position on the phase axis."""
+        return {name: i for i, name in enumerate(self.get_phase_names())}
 
+    @cached_property
+    def _composition_soa(self) -> np.ndarray:
+        """Composition data as (unit, steps, phases, elements) array."""
         try:
             data = self.data["data_vars"]["composition"]["data"][0]
         except KeyError:
             data = self.data["data_vars"]["phase_composition"]["data"][0]
+        return _to_soa(data, dtype=float)
+
+    def _get_composition(self, phase: str, unit: str):
+        try:
+            phase_index = self._phase_index[phase]
+        except KeyError as exc:
+            raise KeyError(f"Phase '{phase}' not found in data") from exc
 
         selector = 1 if unit == "mass" else 0
-        comp = [[[elem[selector] for elem in row] for row in block] for block in data]
-        return [block[phase_index] for block in comp]
+        return self._composition_soa[selector, :, phase_index, :]
 
     def _get_volume_fraction(self):
         return self.data["data_vars"]["volume_fraction"]["data"][0]
 
+    @cached_property
+    def _phase_fraction_soa(self) -> np.ndarray:
+        """Phase-fraction data as (unit, blocks, steps, phases) array."""
+        dtype = np.float32 if self._float32 else np.float64
+        return _to_soa(self.data["data_vars"]["phase_fraction"]["data"], dtype=dtype)
+
     def _get_phase_fraction(self, unit: str, parameter: bool):
         """Return raw phase-fraction data."""
-        data = self.data["data_vars"]["phase_fraction"]["data"]
         selector = 1 if unit == "mass" else 0
 
         if parameter:
-            return [[[elem[selector] for elem in row] for row in block] for block in data]
-        return [[elem[selector] for elem in plane] for plane in data[0]]
+            return self._phase_fraction_soa[selector]
+        return self._phase_fraction_soa[selector, 0]
 
     # --- Public interface ---------------------------------------------------
 
@@ -90,20 +119,15 @@ class PhasesAndTemps(SingleModel):
 
     def get_composition(self, phases=None, unit="mole"):
         """Return composition of given phases over temperature."""
-        phaselist = self.get_phase_names_df()
         if phases is None:
             phases = self.get_phase_names()
 
-        elements = self._get_elements()
-        df_all = []
-
-        for phase in phases:
-            comp = self._get_composition(phase, unit, phaselist)
-            part = pd.DataFrame(comp, columns=elements)
-            part["Phase"] = phase
-            df_all.append(part)
+        comp_blocks = [self._get_composition(phase, unit) for phase in phases]
+        lens = [block.shape[0] for block in comp_blocks]
 
-        return pd.concat(df_all, ignore_index=True)
+        df = pd.DataFrame(np.concatenate(comp_blocks, axis=0), columns=self._get_elements())
+        df["Phase"] = np.repeat(np.asarray(phases, dtype=object), lens)
+        return df
 
     def get_phase_fraction(self, phase_unit="mole", temp_unit="C", parameter=False):
         """Return DataFrame with phase fractions."""
@@ -114,14 +138,17 @@ class PhasesAndTemps(SingleModel):
 
         if parameter:
             components = self.get_components()
-            df_all = []
-            for params, temp_values, values in zip(components.values, temps, phase_values):
-                pa_df = pd.DataFrame([params] * len(temp_values), columns=components.columns)
-                tm_df = pd.DataFrame(temp_values, columns=[f"Temperature in {temp_unit}"])
-                pf_df = pd.DataFrame(values, columns=phases)
-                df = pd.concat([pa_df, tm_df, pf_df], axis=1)
-                df_all.append(df)
-            return pd.concat(df_all, ignore_index=True)
+            n_blocks = min(len(components), len(temps))
+            block_lens = [len(t) for t in temps[:n_blocks]]
+            phase_flat = np.concatenate(phase_values[:n_blocks], axis=0)
+
+            columns = {
+                c: np.repeat(components[c].to_numpy()[:n_blocks], block_lens)
+                for c in components.columns
+            }
+            columns[f"Temperature in {temp_unit}"] = np.concatenate(temps[:n_blocks])
+            columns.update(zip(phases, phase_flat.T))
+            return pd.DataFrame(columns)
 
         temp_df = pd.DataFrame(temps, columns=[f"Temperature in {temp_unit}"])
         phase_df = pd.DataFrame(phase_values, columns=phases)
@@ -137,4 +164,4 @@ class PhasesAndTemps(SingleModel):
     def get_temperatures(self, unit="C", parameter=False):
         """Return temperature values."""
         temps = self._get_temperatures(unit, parameter)
-        return pd.DataFrame(temps, columns=[f"Temperature in {unit}"])
+        return pd.DataFrame(temps, columns=[f"Temperature in {unit}"], copy=True)
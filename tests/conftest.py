@@ -41,4 +41,42 @@ def mock_json_data():
                 "data_vars": {"temperature": {"data": [[[1200, 1400, 1600]]]}}
             },
         }
-    }
\ No newline at end of file
+    }
+
+@pytest.fixture
+def mock_solidification_data():
+    """Mock solidification model with a LIQUID region and "None" markers."""
+    def cell(c):
+        # temperature_by_phase_region stores units as C, F, K
+        if c is None:
+            return ["None", "None", "None"]
+        return [c, c * 1.8 + 32, c + 273.0]
+
+    return {
+        "models": {
+            "scheil": {
+                "coords": {
+                    "component": {"data": ["Al", "Si"]},
+                    "phase": {"data": ["LIQUID", "FCC_A1"]},
+                    "solidification_region": {
+                        "data": ["LIQUID", "FCC_A1", "FCC_A1+LAVES"]
+                    },
+                },
+                "data_vars": {
+                    "temperature_values": {
+                        "data": [[[1500.0, 1773.0, 2732.0],
+                                  [1400.0, 1673.0, 2552.0],
+                                  [1300.0, 1573.0, 2372.0]]]
+                    },
+                    "temperature_by_phase_region": {
+                        "data": [[
+                            [cell(1500.0), cell(None), cell(None)],
+                            [cell(1400.0), cell(1400.0), cell(None)],
+                            [cell(1300.0), cell(None), cell(1300.0)],
+                        ]]
+                    },
+                    "percent_solidified_molar_values": {"data": [[0, 40, 80, 100]]},
+                },
+            },
+        }
+    }
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("ipywidgets")
+from icmdoutput.models.user_scripts import interactive_plots as ip
+
+DATA = {
+    (90.0, 5.0, 5.0): "a",
+    (80.0, 10.0, 10.0): "b",
+    (70.0, 20.0, 10.0): "c",
+}
+
+
+@pytest.fixture(params=["kdtree", "linear"])
+def key_index(request, monkeypatch):
+    if request.param == "kdtree":
+        pytest.importorskip("scipy")
+    else:
+        monkeypatch.setattr(ip, "cKDTree", None)
+    index = ip._KeyIndex.from_dict(DATA)
+    assert (index.tree is None) == (request.param == "linear")
+    return index
+
+
+def test_get_data_slice_exact_hit(key_index):
+    g, target = ip.get_data_slice(DATA, {"Fe": 5.0, "Si": 5.0}, key_index)
+    assert g == "a"
+    assert target == {"Al": 90.0, "Fe": 5.0, "Si": 5.0}
+
+
+def test_get_data_slice_nearest_hit(key_index):
+    g, _ = ip.get_data_slice(DATA, {"Fe": 19.0, "Si": 11.0}, key_index)
+    assert g == "c"
+    g, _ = ip.get_data_slice(DATA, {"Fe": 9.0, "Si": 9.0}, key_index)
+    assert g == "b"
+
+
+def test_get_data_slice_without_index():
+    g, _ = ip.get_data_slice(DATA, {"Fe": 6.0, "Si": 4.0})
+    assert g == "a"
+
+
+def test_make_elem_sliders_options():
+    keys = np.array(list(DATA))
+    for comp in (keys, ip._KeyIndex.from_dict(DATA)):
+        sliders = ip.make_elem_sliders(["Al", "Fe", "Si"], comp)
+        assert list(sliders) == ["Fe", "Si"]
+        assert sliders["Fe"].options == (5.0, 10.0, 20.0)
+        assert sliders["Fe"].value == 10.0
+        assert sliders["Si"].options == (5.0, 10.0)
+
+
+def test_plot_composition_scheil_onset_marker(monkeypatch):
+    shown = []
+    monkeypatch.setattr(ip.go.Figure, "show", lambda self, **kwargs: shown.append(self))
+    g = pd.DataFrame({
+        "Temperature in C": [1000.0, 990.0, 980.0, 970.0],
+        "SOLID": [0.0, 0.3, 0.7, 1.0],
+        "LIQUID": [1.0, 0.7, 0.3, 0.0],
+        "FCC_A1": [0.0, 0.4, 0.6, 0.0],
+        "BCC_A2": [0.0, 0.0, 0.0, np.nan],
+        "Fe": [5.0, 5.0, 5.0, 5.0],
+    })
+    ip.plot_composition_scheil(g, ["Fe"], {"Fe": 5.0})
+
+    (fig,) = shown
+    markers = {t.name: (t.x, t.y) for t in fig.data if t.mode == "markers+text"}
+    # Last step above threshold in f[1:] is index 1
+    assert markers == {"FCC_A1": ((0.3,), (990.0,))}
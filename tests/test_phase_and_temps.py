@@ -1,4 +1,5 @@
 import json
+import pytest
 from icmdoutput.redundant_data import PhasesAndTemps
 
 def test_phase_fraction_and_temps(tmp_path, mock_json_data):
@@ -9,4 +10,70 @@ def test_phase_fraction_and_temps(tmp_path, mock_json_data):
     df_t = pt.get_temperatures()
     assert "Temperature in C" in df_t.columns
     fracs = pt.get_phase_fraction()
-    assert fracs.shape[0] > 0
\ No newline at end of file
+    assert fracs.shape[0] > 0
+
+def test_phase_fraction_returns_independent_frames(tmp_path, mock_json_data):
+    f = tmp_path / "mock.json"
+    f.write_text(json.dumps(mock_json_data))
+    pt = PhasesAndTemps(str(f), "modelA")
+
+    first = pt.get_phase_fraction()
+    first["extra"] = 1
+    first.iloc[0, 1] = 99
+    first["FCC_A1"] += 1000
+    second = pt.get_phase_fraction()
+    assert "extra" not in second.columns
+    assert list(second.columns) == ["Temperature in C", "LIQ", "FCC_A1"]
+    assert second.iloc[0].tolist() == [1000, 0.2, 0.3]
+
+    temps = pt.get_temperatures("K")
+    temps.iloc[0, 0] = -999
+    temps["Temperature in K"] += 1000
+    assert pt.get_temperatures("K").iloc[0, 0] == 1273
+    assert pt.get_phase_fraction(temp_unit="K").iloc[0, 0] == 1273
+
+
+def test_phase_fraction_parameter(tmp_path, mock_json_data):
+    f = tmp_path / "mock.json"
+    f.write_text(json.dumps(mock_json_data))
+    pt = PhasesAndTemps(str(f), "modelA")
+
+    fracs = pt.get_phase_fraction(phase_unit="mass", parameter=True)
+    assert list(fracs.columns) == ["Fe", "C", "Temperature in C", "LIQ", "FCC_A1"]
+    assert fracs.iloc[0].tolist() == [0.8, 0.2, 1000, 0.8, 0.7]
+
+
+def test_phase_fraction_float32(tmp_path, mock_json_data):
+    f = tmp_path / "mock.json"
+    f.write_text(json.dumps(mock_json_data))
+    pt = PhasesAndTemps(str(f), "modelA", float32=True)
+
+    fracs = pt.get_phase_fraction()
+    assert fracs["LIQ"].dtype == "float32"
+    assert abs(fracs["FCC_A1"].iloc[0] - 0.3) < 1e-6
+
+
+def test_raw_accessors_are_read_only(tmp_path, mock_json_data):
+    f = tmp_path / "mock.json"
+    f.write_text(json.dumps(mock_json_data))
+    pt = PhasesAndTemps(str(f), "modelA")
+
+    temps = pt._get_temperatures("C", parameter=False)
+    with pytest.raises(ValueError):
+        temps[0] = -999
+    with pytest.raises(ValueError):
+        pt._get_phase_fraction("mole", parameter=True)[0, 0, 0] = 42
+    assert pt._get_temperatures("C", parameter=False)[0] == 1000
+
+
+def test_null_temperature_stays_float(tmp_path, mock_json_data):
+    model = mock_json_data["models"]["modelA"]
+    model["data_vars"]["temperature"]["data"] = [[[1000, 1273, 1832], [None, None, None]]]
+    model["data_vars"]["phase_fraction"]["data"][0].append([[0.1, 0.1], [0.2, 0.2]])
+    f = tmp_path / "mock.json"
+    f.write_text(json.dumps(mock_json_data))
+    pt = PhasesAndTemps(str(f), "modelA")
+
+    for df in (pt.get_temperatures(), pt.get_phase_fraction()):
+        assert df["Temperature in C"].dtype == "float64"
+        assert df["Temperature in C"].isna().tolist() == [False, True]
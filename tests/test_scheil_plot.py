@@ -1,9 +1,69 @@
 import json
-from icmdoutput.models.user_scripts.scheil_plotting import Scheil
+import numpy as np
+import pytest
+from icmdoutput.models.user_scripts.scheil_plotting import Scheil, _encode_masks
 
 def test_scheil_plot_builds(tmp_path, mock_json_data):
     f = tmp_path / "mock.json"
     f.write_text(json.dumps(mock_json_data))
     s = Scheil(str(f), "modelA")
     df = s.get_scheil_df()
-    assert "Percent solidified molar" in df.columns
\ No newline at end of file
+    assert "Percent solidified molar" in df.columns
+
+def test_scheil_temp_by_phase_regions(tmp_path, mock_json_data):
+    f = tmp_path / "mock.json"
+    f.write_text(json.dumps(mock_json_data))
+    s = Scheil(str(f), "modelA")
+    df = s.get_temp_by_phase()
+    assert list(df["Phase Region"]) == ["FCC_A1+LIQ"]
+    assert list(s._compute_temp_by_phase(threshold=0.25)["Phase Region"]) == ["FCC_A1"]
+
+
+def test_scheil_phase_fraction_arr_units(tmp_path, mock_json_data):
+    f = tmp_path / "mock.json"
+    f.write_text(json.dumps(mock_json_data))
+    s = Scheil(str(f), "modelA")
+    assert "_pf_mass_arr" not in s.__dict__
+    assert s._phase_fraction_arr("mass").tolist() == [[0.8, 0.7]]
+    with pytest.raises(ValueError):
+        s._phase_fraction_arr("volume")
+
+
+@pytest.mark.parametrize("width", [0, 1, 7, 64])
+def test_encode_masks_packs_row_bits(width):
+    rng = np.random.default_rng(width)
+    mask = rng.random((50, width)) > 0.5
+    expected = [sum(1 << int(j) for j in np.flatnonzero(row)) for row in mask]
+
+    keys = _encode_masks(mask)
+    assert keys.dtype == np.uint64
+    assert keys.tolist() == expected
+
+
+def test_scheil_step_plot_traces_match_melt(tmp_path, mock_json_data):
+    model = mock_json_data["models"]["modelA"]
+    model["data_vars"]["temperature"]["data"] = [
+        [[1000, 1273, 1832], [1100, 1373, 2012], [900, 1173, 1652]]
+    ]
+    model["data_vars"]["phase_fraction"]["data"] = [[
+        [[0.2, 0.8], [0.3, 0.7]],
+        [[0.9, 0.1], [0.05, 0.95]],
+        [[0.1, 0.5], [0.6, 0.5]],
+    ]]
+    f = tmp_path / "mock.json"
+    f.write_text(json.dumps(mock_json_data))
+    s = Scheil(str(f), "modelA")
+
+    df = s.get_phase_fraction()
+    expected = (
+        df.melt(id_vars=["Temperature in C"], value_vars=["LIQ", "FCC_A1"],
+                var_name="Phase", value_name="Phase Fraction")
+        .sort_values("Temperature in C", kind="stable")
+    )
+    fig = s.scheil_step_plot()
+    # One trace per phase in phase-name order, temperatures ascending within it
+    assert [t.name for t in fig.data] == ["LIQ", "FCC_A1"]
+    for trace in fig.data:
+        part = expected[expected["Phase"] == trace.name]
+        assert list(trace.x) == part["Temperature in C"].tolist() == [900, 1000, 1100]
+        assert list(trace.y) == part["Phase Fraction"].tolist()
@@ -1,4 +1,5 @@
 import json
+import pandas as pd
 from icmdoutput.models.solidification import Solidification
 
 def test_solidification_basic(tmp_path, mock_json_data):
@@ -9,4 +10,46 @@ def test_solidification_basic(tmp_path, mock_json_data):
     df_regions = solid.get_solid_regions()
     assert not df_regions.empty
     scheil_df = solid.get_data_for_scheil_plot()
-    assert "Phase Region" in scheil_df.columns
\ No newline at end of file
+    assert "Phase Region" in scheil_df.columns
+
+def test_data_for_scheil_plot_regions(tmp_path, mock_solidification_data):
+    f = tmp_path / "mock.json"
+    f.write_text(json.dumps(mock_solidification_data))
+    solid = Solidification(str(f), "scheil")
+
+    df = solid.get_data_for_scheil_plot()
+    # Truncated to the three temperature steps, LIQUID never counts
+    assert list(df.columns) == ["Percent solidified molar", "Temperature in C", "Phase Region"]
+    assert df["Percent solidified molar"].tolist() == [0, 40, 80]
+    assert df["Temperature in C"].tolist() == [1500.0, 1400.0, 1300.0]
+    assert pd.isna(df["Phase Region"].iloc[0])
+    assert df["Phase Region"].iloc[1:].tolist() == ["FCC_A1", "FCC_A1+LAVES"]
+
+    assert "Temperature in K" in solid.get_data_for_scheil_plot(temp_unit="K").columns
+
+
+def test_temperature_by_phase_region_values(tmp_path, mock_solidification_data):
+    f = tmp_path / "mock.json"
+    f.write_text(json.dumps(mock_solidification_data))
+    solid = Solidification(str(f), "scheil")
+
+    df = solid.get_temperature_by_phase_region(unit="K")
+    # Marker-free columns are numeric, mixed columns keep "None" next to floats
+    assert df["LIQUID"].dtype == "float64"
+    assert df["LIQUID"].tolist() == [1773.0, 1673.0, 1573.0]
+    assert df["FCC_A1"].dtype == object
+    assert df["FCC_A1"].tolist() == ["None", 1673.0, "None"]
+
+
+def test_data_for_scheil_plot_liquid_only(tmp_path, mock_solidification_data):
+    model = mock_solidification_data["models"]["scheil"]
+    model["coords"]["solidification_region"]["data"] = ["LIQUID"]
+    regions = model["data_vars"]["temperature_by_phase_region"]["data"]
+    regions[0] = [row[:1] for row in regions[0]]
+    f = tmp_path / "mock.json"
+    f.write_text(json.dumps(mock_solidification_data))
+    solid = Solidification(str(f), "scheil")
+
+    df = solid.get_data_for_scheil_plot()
+    assert len(df) == 3
+    assert df["Phase Region"].isna().all()